@@ -5,16 +5,30 @@ import requests   # To send HTTP requests from the Streamlit UI to the Flask API
 from flask import Flask, request, jsonify  # Flask modules for building the API.
 import base64     # For encoding/decoding binary data (used for audio).
 import json       # For working with JSON data (e.g., converting dictionaries to JSON strings).
+import re         # For escaping Markdown special characters in text shown on the UI.
+
+# orjson is optional: when it is installed, the API response is serialized with it,
+# which is much faster than jsonify for large results.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Worker processes of the NLP process pool (see nlp_pipeline.py) are started with
+# "spawn", which re-runs this script under the name "__mp_main__". The workers only
+# need the NLP modules, so everything with side effects (reading the Streamlit
+# secrets, starting the Flask API) is skipped in them.
+IS_NLP_WORKER = __name__ == "__mp_main__"
 
 # Import processing modules.
 # These modules perform tasks like scraping news, cleaning text, sentiment analysis, etc.
-from scraper import fetch_and_scrape_articles  # Fetches and scrapes news articles using NewsAPI and BeautifulSoup.
-from preprocessing import clean_text             # Cleans the text by removing HTML tags and unwanted characters.
-from sentiment_analysis import analyze_sentiment   # Analyzes text sentiment using NLTK VADER.
-from topic_extraction import extract_topics        # Extracts key topics from the text using RAKE.
+from nlp_pipeline import process_articles          # Cleans the text, analyzes sentiment and extracts topics for each article.
 from comparative_analysis import compare_articles    # Compares articles to find common and unique topics and sentiment counts.
 from tts import text_to_speech_hindi               # Converts text to Hindi speech using gTTS.
-from openai_agent import get_business_context       # Uses OpenAI's API to refine and improve business insights.
+if not IS_NLP_WORKER:
+    # Both modules read the API keys from the Streamlit secrets when imported.
+    from scraper import fetch_and_scrape_articles  # Fetches and scrapes news articles using NewsAPI and BeautifulSoup.
+    from openai_agent import get_business_context   # Uses OpenAI's API to refine and improve business insights.
 
 
 # Helper Functions for Comparative Analysis
@@ -135,6 +149,28 @@ def trim_analysis(final_output):
 # Create a new Flask application instance.
 flask_app = Flask(__name__)
 
+def json_response(data):
+    """
+    Builds a JSON response for the given data.
+    
+    Uses orjson when it is installed and falls back to Flask's jsonify otherwise.
+    Both sort the keys, so the decoded JSON and the key order are the same either way.
+    The bytes differ: jsonify escapes non-ASCII characters (such as the Hindi summary)
+    as \\uXXXX and adds a trailing newline, while orjson writes raw UTF-8 without one.
+    
+    Parameters:
+      data (dict): The data to return.
+    
+    Returns:
+      Response: A Flask response with the application/json mimetype.
+    """
+    if orjson is None:
+        return jsonify(data)
+    return flask_app.response_class(
+        orjson.dumps(data, option=orjson.OPT_SORT_KEYS),
+        mimetype="application/json"
+    )
+
 @flask_app.route('/analyze-news', methods=['POST'])
 def analyze_news():
     """
@@ -162,26 +198,11 @@ def analyze_news():
         if not scraped_articles:
             return jsonify({"error": "No articles found or error during scraping."}), 404
         
-        processed_articles = []
-        # Process each scraped article.
-        for article in scraped_articles:
-            title = article.get("title", "No title")
-            summary = article.get("summary", "No summary")
-            content = f"{title}. {summary}"
-            
-            # Clean the text and perform sentiment analysis and topic extraction.
-            cleaned_text_val = clean_text(content)
-            sentiment, scores = analyze_sentiment(cleaned_text_val)
-            topics = extract_topics(cleaned_text_val, num_topics=3)
-            
-            # Add the processed article data to our list.
-            processed_articles.append({
-                "Title": title,
-                "Summary": summary,
-                "Sentiment": sentiment,
-                "Topics": topics,
-                "URL": article.get("url", "")
-            })
+        # Clean each article and perform sentiment analysis and topic extraction.
+        # Large batches can run on a process pool (see nlp_pipeline.py).
+        # The Article records are converted to the response dictionaries only once, here.
+        processed_articles = [article.to_dict() for article in process_articles(scraped_articles)]
+        del scraped_articles
         
         # Perform a basic comparative analysis on the processed articles.
         comp_analysis = compare_articles(processed_articles)
@@ -212,7 +233,7 @@ def analyze_news():
         final_output["Refined Business Analysis"] = refined_context
         
         # Return the final output as a JSON response.
-        return jsonify(final_output)
+        return json_response(final_output)
     except Exception as e:
         # If any error occurs, return the error message in JSON.
         return jsonify({"error": str(e)}), 500
@@ -229,7 +250,8 @@ def run_flask():
 
 
 # Check if the API has already started using Streamlit's session state.
-if "API_STARTED" not in st.session_state:
+# NLP worker processes never start it (see IS_NLP_WORKER above).
+if not IS_NLP_WORKER and "API_STARTED" not in st.session_state:
     # Start the Flask server in a new background thread.
     threading.Thread(target=run_flask, daemon=True).start()
     # Wait a little to allow the Flask server to initialize.
@@ -240,13 +262,160 @@ if "API_STARTED" not in st.session_state:
 # Streamlit UI Code
 
 
+# The API endpoint (running on localhost within the container).
+API_URL = "http://localhost:5000/analyze-news"
+
+# Number of articles and coverage comparisons shown on each page of results.
+ARTICLES_PER_PAGE = 5
+COMPARISONS_PER_PAGE = 10
+
+# The result cache is shared by every session, so it keeps at most this many
+# responses (each with its audio and coverage differences) in memory.
+MAX_CACHED_RESULTS = 32
+
+
+class APIError(Exception):
+    """
+    Raised when the API returns an error response.
+    """
+
+
+@st.cache_resource(ttl=600, max_entries=MAX_CACHED_RESULTS, show_spinner="Analyzing news articles...")
+def fetch_analysis(query, page_size):
+    """
+    Sends a POST request to the Flask API and returns the parsed JSON output.
+    
+    Results are cached by query and page size (for 10 minutes, and at most
+    MAX_CACHED_RESULTS at a time), so reruns of the script (for example when the
+    user changes the page of results) do not call the API again.
+    st.cache_resource is used instead of st.cache_data because it returns the cached
+    object itself rather than unpickling a copy on every rerun, which would make each
+    rerun cost grow with the size of the response. The returned dictionary is shared,
+    so callers must treat it as read-only.
+    Errors are raised instead of returned, so that they are never cached.
+    
+    Parameters:
+      query (str): The company or topic to search for.
+      page_size (int): The number of articles to fetch.
+    
+    Returns:
+      dict: The final output returned by the API.
+    """
+    payload = {"query": query, "page_size": page_size}
+    response = requests.post(API_URL, json=payload)
+    # If the response is not successful, raise an error with the API's message.
+    if response.status_code != 200:
+        try:
+            error_msg = response.json().get("error", "Unknown error occurred.")
+        except Exception:
+            error_msg = "Unknown error occurred."
+        raise APIError(error_msg)
+    return response.json()
+
+
+def escape_markdown(text):
+    """
+    Escapes Markdown special characters so that text from the API is shown as-is.
+    
+    Streamlit renders strings as Markdown, where "$...$" becomes inline LaTeX (for
+    example in "Tesla jumps $20, analysts lift target to $300") and characters like
+    "*", "_" and "#" change the formatting.
+    
+    Parameters:
+      text (str): The text to escape.
+    
+    Returns:
+      str: The text with every Markdown special character escaped with a backslash.
+    """
+    return re.sub(r"([\\`*_{}\[\]()#+\-.!|~$<>])", r"\\\1", str(text))
+
+
+def paginate(items, per_page, key):
+    """
+    Shows a page selector and returns the items on the selected page
+    together with the index of the first of them.
+    
+    Parameters:
+      items (list): The full list of items.
+      per_page (int): The number of items on each page.
+      key (str): A unique Streamlit widget key for the page selector.
+    
+    Returns:
+      tuple: (list of items on the current page, index of the first item on the page)
+    """
+    num_pages = max(1, (len(items) + per_page - 1) // per_page)
+    # A stored page can be past the end if a refetched result (after the cache
+    # expired) has fewer items, and st.number_input raises for such a value.
+    if st.session_state.get(key, 1) > num_pages:
+        st.session_state[key] = num_pages
+    page = 1
+    if num_pages > 1:
+        page = st.number_input(f"Page (1-{num_pages})", min_value=1, max_value=num_pages, key=key)
+    start = (page - 1) * per_page
+    return items[start:start + per_page], start
+
+
+def render_results(final_output):
+    """
+    Displays the API output one section at a time.
+    
+    Only one page of articles and coverage comparisons is rendered on each run,
+    and the audio and the raw JSON are only decoded and rendered when the user
+    asks for them, so the page stays fast as the number of articles grows.
+    
+    Parameters:
+      final_output (dict): The final output returned by the API (read-only).
+    """
+    st.header(escape_markdown(final_output.get("Company", "")))
+    
+    # Show the Hindi sentiment summary and, only on request, its audio.
+    st.subheader("Final Sentiment Analysis")
+    st.markdown(escape_markdown(final_output.get("Final Sentiment Analysis", "")))
+    if final_output.get("Audio") and st.checkbox("Play Hindi audio summary"):
+        audio_bytes = base64.b64decode(final_output["Audio"])
+        st.audio(audio_bytes, format="audio/mp3")
+    
+    st.subheader("Refined Business Analysis")
+    st.markdown(escape_markdown(final_output.get("Refined Business Analysis", "")))
+    
+    comparative = final_output.get("Comparative Sentiment Score", {})
+    st.subheader("Sentiment Distribution")
+    st.json(comparative.get("Sentiment Distribution", {}))
+    st.subheader("Topic Overlap")
+    st.json(comparative.get("Topic Overlap", {}))
+    
+    # Show the articles one page at a time.
+    articles = final_output.get("Articles", [])
+    st.subheader(f"Articles ({len(articles)})")
+    page_articles, start = paginate(articles, ARTICLES_PER_PAGE, key="articles_page")
+    # Text from the API is escaped; the bold number prefix is the only Markdown added here.
+    for number, article in enumerate(page_articles, start=start + 1):
+        st.markdown(f"**{number}.** {escape_markdown(article.get('Title', ''))}")
+        st.markdown(escape_markdown(article.get("Summary", "")))
+        st.markdown(escape_markdown(f"Sentiment: {article.get('Sentiment', '')} | Topics: {', '.join(article.get('Topics', []))}"))
+        if article.get("URL"):
+            st.link_button("Read the article", article["URL"])
+    
+    # Show the coverage differences one page at a time.
+    differences = comparative.get("Coverage Differences", [])
+    st.subheader(f"Coverage Differences ({len(differences)})")
+    page_differences, start = paginate(differences, COMPARISONS_PER_PAGE, key="comparisons_page")
+    for number, difference in enumerate(page_differences, start=start + 1):
+        st.markdown(f"**{number}.** {escape_markdown(difference.get('Comparison', ''))}")
+        st.caption(escape_markdown(difference.get("Impact", "")))
+    
+    # The full JSON (without the Base64 audio) is only rendered on request.
+    if st.checkbox("Show raw JSON"):
+        st.json({key: value for key, value in final_output.items() if key != "Audio"})
+
+
 def main():
     """
     Main function for the Streamlit user interface.
     It:
       - Displays input fields for the company/topic and number of articles.
-      - Sends a POST request to the Flask API.
-      - Displays the JSON output and plays the Hindi TTS audio.
+      - Sends a POST request to the Flask API (cached by query and page size).
+      - Displays the results page by page and plays the Hindi TTS audio on request.
     """
     st.title("News Sentiment & Comparative Analyzer")
     
@@ -255,43 +424,32 @@ def main():
     # Get user input for the number of articles to fetch.
     page_size = st.number_input("Number of Articles", min_value=1, max_value=20, value=10)
     
-    # When the user clicks the "Search" button, proceed with the request.
+    # When the user clicks the "Search" button, remember the search, so that the
+    # results stay on screen when later widget changes rerun the script.
     if st.button("Search"):
         if not query:
             st.error("Please enter a company or topic to search.")
             return
-        
-        # Create the payload with the query and page size.
-        payload = {"query": query, "page_size": page_size}
-        # Specify the API endpoint (running on localhost within the container).
-        api_url = "http://localhost:5000/analyze-news"
-        st.write("Using API endpoint:", api_url)
-        
-        try:
-            # Send a POST request with the payload to the API.
-            response = requests.post(api_url, json=payload)
-            # If the response is not successful, display an error message.
-            if response.status_code != 200:
-                try:
-                    error_msg = response.json().get("error", "Unknown error occurred.")
-                except Exception:
-                    error_msg = "Unknown error occurred."
-                st.error("Error: " + error_msg)
-                return
-            
-            # Parse the JSON response from the API.
-            final_output = response.json()
-            # Display the final output as pretty JSON on the Streamlit UI.
-            st.json(final_output)
-            
-            # If audio data is present, decode it from Base64 and play it.
-            if final_output.get("Audio"):
-                audio_b64 = final_output["Audio"]
-                audio_bytes = base64.b64decode(audio_b64)
-                st.audio(audio_bytes, format="audio/mp3")
-                
-        except Exception as e:
-            st.error(f"Failed to connect to API: {e}")
+        st.session_state["SEARCH"] = (query, int(page_size))
+        # Start from the first page of every new result.
+        st.session_state.pop("articles_page", None)
+        st.session_state.pop("comparisons_page", None)
+    
+    if "SEARCH" not in st.session_state:
+        return
+    
+    search_query, search_page_size = st.session_state["SEARCH"]
+    st.write("Using API endpoint:", API_URL)
+    try:
+        final_output = fetch_analysis(search_query, search_page_size)
+    except APIError as e:
+        st.error("Error: " + str(e))
+        return
+    except Exception as e:
+        st.error(f"Failed to connect to API: {e}")
+        return
+    
+    render_results(final_output)
 
 # Run the main function when this script is executed.
 if __name__ == "__main__":
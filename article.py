@@ -0,0 +1,49 @@
+from typing import List, Optional  # For the type hints of the article fields.
+
+
+class Article:
+    """
+    A compact record for a single news article as it moves through the pipeline.
+
+    The scraper creates it with the title, summary, publication date and URL, and the
+    NLP stage fills in the sentiment and topics on the same object. Using __slots__
+    instead of a per-instance __dict__ keeps large batches of articles small in memory.
+
+    Fields:
+      title (str): The title of the article.
+      summary (str): A short summary of the article.
+      published (Optional[str]): The publication date, if the page gives one.
+      url (str): The link to the original article.
+      sentiment (Optional[str]): "Positive", "Negative" or "Neutral" once analyzed.
+      topics (List[str]): The key topics extracted from the article.
+    """
+
+    __slots__ = ("title", "summary", "published", "url", "sentiment", "topics")
+
+    def __init__(self, title: str = "No title", summary: str = "No summary",
+                 published: Optional[str] = None, url: str = "",
+                 sentiment: Optional[str] = None, topics: Optional[List[str]] = None) -> None:
+        self.title = title
+        self.summary = summary
+        self.published = published
+        self.url = url
+        self.sentiment = sentiment
+        self.topics = topics if topics is not None else []
+
+    def to_dict(self) -> dict:
+        """
+        Converts the article to the dictionary used in the API response.
+
+        Returns:
+          dict: A dictionary with keys "Title", "Summary", "Sentiment", "Topics" and "URL".
+        """
+        return {
+            "Title": self.title,
+            "Summary": self.summary,
+            "Sentiment": self.sentiment,
+            "Topics": self.topics,
+            "URL": self.url
+        }
+
+    def __repr__(self) -> str:
+        return f"Article(title={self.title!r}, url={self.url!r}, sentiment={self.sentiment!r})"
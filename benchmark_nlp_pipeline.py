@@ -0,0 +1,66 @@
+import time      # For timing each run.
+import random    # For building synthetic articles.
+
+import nlp_pipeline  # The NLP stage being benchmarked.
+from article import Article  # Compact record for a scraped article.
+
+# Batch sizes to compare between in-process and process-pool execution.
+BATCH_SIZES = [10, 50, 100, 200, 500, 1000, 2000]
+
+WORDS = [
+    "company", "shares", "growth", "profit", "loss", "market", "investors", "record",
+    "decline", "strong", "weak", "quarter", "revenue", "launch", "lawsuit", "expansion",
+    "<b>earnings</b>", "surge", "drop", "analysts", "outlook", "electric", "vehicles", "deal",
+]
+
+
+def make_articles(n, seed=0):
+    """
+    Builds n synthetic scraped articles with a title, summary and URL.
+    """
+    rng = random.Random(seed)
+    articles = []
+    for i in range(n):
+        title = " ".join(rng.choice(WORDS) for _ in range(8))
+        summary = ". ".join(" ".join(rng.choice(WORDS) for _ in range(15)) for _ in range(3))
+        articles.append(Article(title=title, summary=summary, url=f"https://example.com/{i}"))
+    return articles
+
+
+def time_run(articles, use_process_pool):
+    """
+    Returns the time in seconds taken to process the articles once.
+    """
+    start = time.perf_counter()
+    nlp_pipeline.process_articles(articles, use_process_pool=use_process_pool, min_pool_batch_size=0)
+    return time.perf_counter() - start
+
+
+def main():
+    """
+    Times the NLP stage in-process and on the process pool for each batch size
+    and prints the first batch size at which the pool is faster.
+    """
+    # Start the pool and load NLTK resources before timing anything.
+    nlp_pipeline.process_articles(make_articles(100), use_process_pool=True, min_pool_batch_size=0)
+    nlp_pipeline.process_articles(make_articles(10), use_process_pool=False)
+
+    crossover = None
+    print(f"{'articles':>10} {'in-process (s)':>16} {'process pool (s)':>18} {'speedup':>9}")
+    for n in BATCH_SIZES:
+        articles = make_articles(n)
+        serial = min(time_run(articles, False) for _ in range(3))
+        pooled = min(time_run(articles, True) for _ in range(3))
+        print(f"{n:>10} {serial:>16.3f} {pooled:>18.3f} {serial / pooled:>8.2f}x")
+        if crossover is None and pooled < serial:
+            crossover = n
+
+    if crossover is None:
+        print("The process pool was not faster for any batch size tested.")
+    else:
+        print(f"Crossover point: the process pool is faster from {crossover} articles.")
+    nlp_pipeline.shutdown_pool()
+
+
+if __name__ == "__main__":
+    main()
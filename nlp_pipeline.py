@@ -0,0 +1,153 @@
+import os                                   # For reading configuration from environment variables.
+import threading                            # For guarding the shared process pool.
+import multiprocessing                      # For choosing a safe start method for worker processes.
+from concurrent.futures import ProcessPoolExecutor  # For running the NLP stage across several processes.
+from concurrent.futures.process import BrokenProcessPool  # Raised when a worker process dies.
+
+from preprocessing import clean_text                    # Cleans the text by removing HTML tags and unwanted characters.
+from sentiment_analysis import analyze_sentiment, get_analyzer  # Analyzes text sentiment using NLTK VADER.
+from topic_extraction import extract_topics, get_stopwords      # Extracts key topics from the text using RAKE.
+
+# Set NLP_PROCESS_POOL=1 to let large batches run on a pool of worker processes.
+USE_PROCESS_POOL = os.environ.get("NLP_PROCESS_POOL", "0") == "1"
+
+# Batches smaller than this are processed in the current process, because starting
+# work on the pool (pickling articles and results) costs more than it saves.
+# The default is an estimate; run benchmark_nlp_pipeline.py to find the crossover
+# point on the deployment machine and set NLP_MIN_POOL_BATCH_SIZE to match.
+# The scraper gets at most 100 articles from NewsAPI, so the pool only ever runs
+# in the app when NLP_MIN_POOL_BATCH_SIZE is set to 100 or lower.
+MIN_POOL_BATCH_SIZE = int(os.environ.get("NLP_MIN_POOL_BATCH_SIZE", "200"))
+
+# Number of articles sent to a worker in one message, to cut IPC overhead.
+# Values below 1 are raised to 1.
+CHUNK_SIZE = max(1, int(os.environ.get("NLP_CHUNK_SIZE", "50")))
+
+# The pool is created on first use and reused by every later request.
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def process_article(article):
+    """
+    Cleans a single scraped article and runs sentiment analysis and topic extraction on it.
+
+    Parameters:
+      article (Article): A scraped article record.
+
+    Returns:
+      Article: The same record with its sentiment and topics filled in.
+    """
+    content = f"{article.title}. {article.summary}"
+
+    # Clean the text and perform sentiment analysis and topic extraction.
+    cleaned_text_val = clean_text(content)
+    sentiment, scores = analyze_sentiment(cleaned_text_val)
+    article.sentiment = sentiment
+    article.topics = extract_topics(cleaned_text_val, num_topics=3)
+    return article
+
+
+def _init_worker():
+    """
+    Runs once in every worker process and pre-loads the NLTK resources
+    (the VADER lexicon and the stopword list) so that no chunk pays for it.
+    """
+    get_analyzer()
+    get_stopwords()
+
+
+def _process_chunk(chunk):
+    """
+    Processes a chunk of articles inside a worker process.
+    """
+    return [process_article(article) for article in chunk]
+
+
+def _get_pool(max_workers=None):
+    """
+    Returns the shared process pool, creating it on first use.
+
+    The "spawn" start method is used because the Flask API runs in a thread of
+    the Streamlit process, and forking a multi-threaded process is unsafe.
+    Spawned workers re-run app.py as "__mp_main__", so app.py skips its
+    side effects (reading secrets, starting Flask) in that case.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+        return _pool
+
+
+def shutdown_pool():
+    """
+    Shuts down the shared process pool if it was started.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
+
+
+def _discard_broken_pool(pool):
+    """
+    Drops the shared pool after one of its workers died, so that the next
+    batch starts a new pool instead of failing on the broken one.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def process_articles(articles, use_process_pool=None, min_pool_batch_size=None, chunk_size=None, max_workers=None):
+    """
+    Runs the NLP stage (cleaning, sentiment analysis and topic extraction) on a batch of articles.
+
+    Parameters:
+      articles (list): A list of scraped Article records.
+      use_process_pool (bool): Whether large batches may use the process pool
+                               (default is the NLP_PROCESS_POOL setting).
+      min_pool_batch_size (int): Batches smaller than this always run in-process.
+      chunk_size (int): The number of articles sent to a worker at a time (at least 1).
+      max_workers (int): The number of worker processes (default is the CPU count).
+                         Only used when the pool is first created.
+
+    Returns:
+      list: The processed Article records, in the same order as the input.
+            Records processed in-process are updated in place; records processed
+            on the pool are returned as copies. If the pool breaks, the batch is
+            processed in-process.
+    """
+    if use_process_pool is None:
+        use_process_pool = USE_PROCESS_POOL
+    if min_pool_batch_size is None:
+        min_pool_batch_size = MIN_POOL_BATCH_SIZE
+    if chunk_size is None:
+        chunk_size = CHUNK_SIZE
+
+    # Small batches (or a disabled pool) are processed in the current process.
+    if not use_process_pool or len(articles) < min_pool_batch_size:
+        return [process_article(article) for article in articles]
+
+    # Split the batch into chunks; executor.map returns results in submission order.
+    chunk_size = max(1, chunk_size)
+    chunks = [articles[i:i + chunk_size] for i in range(0, len(articles), chunk_size)]
+    pool = _get_pool(max_workers)
+    processed_articles = []
+    try:
+        for processed_chunk in pool.map(_process_chunk, chunks):
+            processed_articles.extend(processed_chunk)
+    except BrokenProcessPool:
+        # A worker died (for example, it ran out of memory). Replace the pool for
+        # later batches and process this batch in the current process instead.
+        _discard_broken_pool(pool)
+        return [process_article(article) for article in articles]
+    return processed_articles
@@ -2,6 +2,8 @@ import requests                      # For sending HTTP requests
 from bs4 import BeautifulSoup        # For parsing HTML content
 import streamlit as st               # For showing errors/messages in Streamlit
 
+from article import Article          # Compact record for a scraped article
+
 # Get the NewsAPI key from the Hugging Face Spaces secrets.
 NEWSAPI_KEY = st.secrets.get("NEWSAPI_KEY")
 if not NEWSAPI_KEY:
@@ -10,7 +12,7 @@ if not NEWSAPI_KEY:
 def fetch_news_articles(query, page_size=10):
     """
     Uses NewsAPI to fetch a list of news articles based on the query.
-    Returns the raw article JSON data.
+    Returns the article entries, keeping only the "url" field of each one.
     
     Parameters:
       query (str): The search term (e.g., "Tesla")
@@ -20,7 +22,8 @@ def fetch_news_articles(query, page_size=10):
       1. Sends a GET request to NewsAPI's 'everything' endpoint.
       2. Passes the query, page size, and API key as parameters.
       3. Checks if the request was successful and the API returned status 'ok'.
-      4. Returns the list of articles if available.
+      4. Returns the list of articles if available, dropping the fields that are not used
+         so that the full NewsAPI payload is not kept alive for the rest of the request.
     """
     # Define the endpoint URL for NewsAPI.
     url = "https://newsapi.org/v2/everything"
@@ -43,7 +46,7 @@ def fetch_news_articles(query, page_size=10):
         if data.get("status") != "ok":
             st.error("Error fetching news articles from NewsAPI.")
             return []
-        return data.get("articles", [])
+        return [{"url": art.get("url", "")} for art in data.get("articles", [])]
     except requests.RequestException as e:
         st.error(f"Error: {e}")
         return []
@@ -62,7 +65,7 @@ def scrape_article_page(url):
       2. Checks if the content is HTML.
       3. Uses BeautifulSoup to extract the title and summary.
       4. Optionally extracts the publication date.
-      5. Returns the scraped data as a dictionary.
+      5. Returns the scraped data as an Article record.
     """
     try:
         response = requests.get(url, timeout=10)
@@ -105,12 +108,7 @@ def scrape_article_page(url):
     elif soup.find("time"):
         published = soup.find("time").get("datetime", None) or soup.find("time").get_text(strip=True)
 
-    return {
-        "title": title,
-        "summary": summary,
-        "published": published,
-        "url": url
-    }
+    return Article(title=title, summary=summary, published=published, url=url)
 
 def fetch_and_scrape_articles(query, page_size=10):
     """
@@ -125,7 +123,7 @@ def fetch_and_scrape_articles(query, page_size=10):
       1. Calls 'fetch_news_articles' to get raw articles.
       2. Loops through each article, extracts its URL.
       3. Calls 'scrape_article_page' to extract details.
-      4. Returns a list of dictionaries with the scraped article data.
+      4. Returns a list of Article records with the scraped article data.
     """
     articles = fetch_news_articles(query, page_size)
     print("Fetched articles count:", len(articles))
@@ -5,6 +5,19 @@ from nltk.sentiment.vader import SentimentIntensityAnalyzer  # Import VADER, a r
 # The 'quiet=True' option suppresses verbose output.
 nltk.download('vader_lexicon', quiet=True)
 
+# A single analyzer instance shared by every call in this process.
+# Building one loads the whole VADER lexicon from disk, so it is created lazily once.
+_analyzer = None
+
+def get_analyzer():
+    """
+    Returns the shared SentimentIntensityAnalyzer, creating it on first use.
+    """
+    global _analyzer
+    if _analyzer is None:
+        _analyzer = SentimentIntensityAnalyzer()
+    return _analyzer
+
 def analyze_sentiment(text):
     """
     Analyzes the sentiment of the input text using VADER.
@@ -17,8 +30,8 @@ def analyze_sentiment(text):
             - sentiment_label (str): "Positive", "Negative", or "Neutral".
             - sentiment_scores (dict): A dictionary with scores for various sentiment metrics.
     """
-    # Create an instance of the SentimentIntensityAnalyzer.
-    sia = SentimentIntensityAnalyzer()
+    # Get the shared instance of the SentimentIntensityAnalyzer.
+    sia = get_analyzer()
     
     # Use the analyzer to get sentiment scores for the given text.
     # The 'polarity_scores' method returns a dictionary with:
@@ -5,6 +5,19 @@ import re
 # Download stopwords; no need for punkt if we use our own sentence tokenizer.
 nltk.download('stopwords', quiet=True)
 
+# English stopwords for RAKE, read from the NLTK corpus once per process
+# instead of on every call.
+_stopwords = None
+
+def get_stopwords():
+    """
+    Returns the cached set of English stopwords used by RAKE.
+    """
+    global _stopwords
+    if _stopwords is None:
+        _stopwords = set(nltk.corpus.stopwords.words('english'))
+    return _stopwords
+
 def simple_sent_tokenize(text):
     """
     A simple sentence tokenizer that splits text on punctuation followed by whitespace.
@@ -28,7 +41,7 @@ def extract_topics(text, num_topics=3):
         return []
     
     # Use our simple sentence tokenizer to avoid the punkt_tab issue
-    r = Rake(sentence_tokenizer=simple_sent_tokenize)
+    r = Rake(stopwords=get_stopwords(), sentence_tokenizer=simple_sent_tokenize)
     r.extract_keywords_from_text(text)
     
     ranked_phrases = r.get_ranked_phrases()